@@ -7,138 +7,157 @@ import re
 import sys
 import os
 import html
+import io
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
+
+# Markdown conversion patterns. Fence languages, list indentation and
+# placeholders are ASCII by construction; text captures stay Unicode.
+_RE_CODE_BLOCK = re.compile(r'```(\w+)?\n(.*?)```', re.DOTALL | re.ASCII)
+_RE_INLINE_CODE = re.compile(r'`([^`\n]+)`')
+_RE_INLINE_PLACEHOLDER = re.compile(r'__INLINE_CODE_(\d+)__', re.ASCII)
+_RE_HEADER = re.compile(r'^(#{1,6}) (.*?)$', re.MULTILINE)
+_RE_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_RE_BOLD = re.compile(r'\*\*(.*?)\*\*')
+_RE_ITALIC = re.compile(r'\*(.*?)\*')
+_RE_LIST_ITEM = re.compile(r'^\s*- (.*)', re.ASCII)
+
+# Blocks that are already HTML (or badges) and must not be wrapped in <p>
+_NO_PARAGRAPH_PREFIXES = ('<h', '<ul', '<pre', '<div', '<li', '[![', '<p>', '<a')
+
+
+def format_code_block(lang, code):
+    """Render a fenced code block with language classes for syntax highlighting."""
+    # HTML escape the code content to prevent XML/HTML interpretation
+    escaped_code = html.escape(code)
+
+    # Add proper language class and structure for syntax highlighting
+    if lang.lower() == 'xml':
+        return f'<pre class="language-xml"><code class="language-xml">{escaped_code}</code></pre>'
+    elif lang.lower() in ['kotlin', 'java', 'groovy']:
+        return f'<pre class="language-{lang.lower()}"><code class="language-{lang.lower()}">{escaped_code}</code></pre>'
+    else:
+        return f'<pre><code class="language-{lang}">{escaped_code}</code></pre>'
+
+
+@lru_cache(maxsize=None)
+def get_mistune_markdown():
+    """Import and build the mistune parser on first use; None if mistune is not installed."""
+    try:
+        import mistune
+    except ImportError:
+        return None
 
+    class CodeBlockRenderer(mistune.HTMLRenderer):
+        """mistune renderer emitting the same code block markup as the regex converter."""
 
-def convert_markdown_to_html(markdown_content):
-    """Convert markdown content to HTML with improved parsing."""
-    content = markdown_content
+        def block_code(self, code, info=None):
+            lang = info.split(None, 1)[0] if info else ''
+            return format_code_block(lang, code) + '\n'
+
+    return mistune.create_markdown(
+        renderer=CodeBlockRenderer(escape=False),
+        plugins=['table', 'strikethrough'],
+    )
 
-    # First, protect code blocks by replacing them with placeholders
-    code_blocks = []
-    def replace_code_block(match):
-        code_blocks.append(match.group(0))
-        return f"__CODE_BLOCK_{len(code_blocks)-1}__"
 
-    content = re.sub(r'```(\w+)?\n(.*?)```', replace_code_block, content, flags=re.DOTALL)
+def convert_markdown_to_html(markdown_content):
+    """Convert markdown content to HTML.
+
+    Uses mistune's single-pass parser when it is installed and falls back to
+    the built-in regex converter otherwise.
+    """
+    markdown = get_mistune_markdown()
+    if markdown is not None:
+        return markdown(markdown_content)
 
-    # Convert inline code (protect these too)
+    out = io.StringIO()
+    block = []
     inline_code = []
+
+    def write_block(block_html):
+        if out.tell():
+            out.write('\n\n')
+        out.write(block_html)
+
     def replace_inline_code(match):
-        inline_code.append(match.group(0))
+        # HTML escape inline code content too
+        inline_code.append(f'<code>{html.escape(match.group(1))}</code>')
         return f"__INLINE_CODE_{len(inline_code)-1}__"
 
-    content = re.sub(r'`([^`\n]+)`', replace_inline_code, content)
-
-    # Convert headers (in order from most specific to least specific)
-    content = re.sub(r'^#### (.*?)$', r'<h4>\1</h4>', content, flags=re.MULTILINE)
-    content = re.sub(r'^### (.*?)$', r'<h3>\1</h3>', content, flags=re.MULTILINE)
-    content = re.sub(r'^## (.*?)$', r'<h2>\1</h2>', content, flags=re.MULTILINE)
-    content = re.sub(r'^# (.*?)$', r'<h1>\1</h1>', content, flags=re.MULTILINE)
-
-    # Convert links (including badges)
-    content = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', content)
-
-    # Convert bold and italic text
-    content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
-    content = re.sub(r'\*(.*?)\*', r'<em>\1</em>', content)
-
-    # Convert nested lists and simple lists
-    lines = content.split('\n')
-    in_list = False
-    result_lines = []
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Handle nested lists (with indentation)
-        if re.match(r'^\s*- ', line):
-            if not in_list:
-                result_lines.append('<ul>')
-                in_list = True
-            # Handle nested items
-            indent_level = len(line) - len(line.lstrip())
-            if indent_level > 0:
-                # This is a nested item
-                nested_item = re.sub(r'^\s*- (.*)', r'<li>\1</li>', line)
-                result_lines.append(f'  {nested_item}')
-            else:
-                # This is a top-level item
-                list_item = re.sub(r'^- (.*)', r'<li>\1</li>', line)
-                result_lines.append(list_item)
-        else:
-            if in_list:
-                result_lines.append('</ul>')
-                in_list = False
-            result_lines.append(line)
-
-        i += 1
-
-    if in_list:
-        result_lines.append('</ul>')
-
-    content = '\n'.join(result_lines)
-
-    # Convert paragraphs (split by double newlines)
-    paragraphs = content.split('\n\n')
-    html_paragraphs = []
-
-    for para in paragraphs:
-        para = para.strip()
-        if para:
-            # Don't wrap headers, lists, code blocks, or existing HTML in paragraphs
-            if not (para.startswith('<h') or para.startswith('<ul') or
-                   para.startswith('<pre') or para.startswith('<div') or
-                   para.startswith('<li') or para.startswith('[![') or
-                   para.startswith('<p>') or para.startswith('<a') or
-                   '__CODE_BLOCK_' in para or '__INLINE_CODE_' in para):
-                para = f'<p>{para}</p>'
-            html_paragraphs.append(para)
-
-    content = '\n\n'.join(html_paragraphs)
-
-    # Now restore the code blocks
-    for i, code_block in enumerate(code_blocks):
-        # Parse the code block properly
-        match = re.match(r'```(\w+)?\n(.*?)```', code_block, flags=re.DOTALL)
-        if match:
-            lang = match.group(1) or ''
-            code = match.group(2)
-
-            # HTML escape the code content to prevent XML/HTML interpretation
-            escaped_code = html.escape(code)
-
-            # Add proper language class and structure for syntax highlighting
-            if lang.lower() == 'xml':
-                formatted_code = f'<pre class="language-xml"><code class="language-xml">{escaped_code}</code></pre>'
-            elif lang.lower() in ['kotlin', 'java', 'groovy']:
-                formatted_code = f'<pre class="language-{lang.lower()}"><code class="language-{lang.lower()}">{escaped_code}</code></pre>'
+    def restore_inline_code(match):
+        return inline_code[int(match.group(1))]
+
+    def replace_header(match):
+        level = len(match.group(1))
+        return f'<h{level}>{match.group(2)}</h{level}>'
+
+    def flush_block():
+        para = '\n'.join(block).strip()
+        block.clear()
+        if not para:
+            return
+        # Don't wrap headers, lists, existing HTML or inline code in paragraphs
+        if '__INLINE_CODE_' in para:
+            para = _RE_INLINE_PLACEHOLDER.sub(restore_inline_code, para)
+        elif not para.startswith(_NO_PARAGRAPH_PREFIXES):
+            para = f'<p>{para}</p>'
+        write_block(para)
+
+    # Split the document once into prose and fenced code. With its two
+    # capture groups this yields [prose, lang, code, prose, lang, code, ...,
+    # prose], so only the prose is run through the markdown conversions.
+    parts = _RE_CODE_BLOCK.split(markdown_content)
+    for i in range(0, len(parts), 3):
+        content = parts[i]
+
+        # Protect inline code from the conversions below
+        content = _RE_INLINE_CODE.sub(replace_inline_code, content)
+
+        # Convert all header levels in a single pass
+        content = _RE_HEADER.sub(replace_header, content)
+
+        # Convert links (including badges)
+        content = _RE_LINK.sub(r'<a href="\2">\1</a>', content)
+
+        # Convert bold and italic text
+        content = _RE_BOLD.sub(r'<strong>\1</strong>', content)
+        content = _RE_ITALIC.sub(r'<em>\1</em>', content)
+
+        # Convert lists and wrap paragraphs in a single pass over the lines
+        in_list = False
+        for line in content.split('\n'):
+            match = _RE_LIST_ITEM.match(line)
+            if match:
+                # Skip empty list items
+                if not match.group(1).strip():
+                    continue
+                if not in_list:
+                    block.append('<ul>')
+                    in_list = True
+                # Nested items keep a two-space indent
+                indent = '  ' if line[0].isspace() else ''
+                block.append(f'{indent}<li>{match.group(1)}</li>')
             else:
-                formatted_code = f'<pre><code class="language-{lang}">{escaped_code}</code></pre>'
-
-            content = content.replace(f'__CODE_BLOCK_{i}__', formatted_code)
-        else:
-            content = content.replace(f'__CODE_BLOCK_{i}__', code_block)
-
-    # Restore inline code
-    for i, inline in enumerate(inline_code):
-        # Parse inline code properly
-        match = re.match(r'`([^`\n]+)`', inline)
-        if match:
-            code = match.group(1)
-            # HTML escape inline code content too
-            escaped_code = html.escape(code)
-            formatted_code = f'<code>{escaped_code}</code>'
-            content = content.replace(f'__INLINE_CODE_{i}__', formatted_code)
-        else:
-            content = content.replace(f'__INLINE_CODE_{i}__', inline)
-
-    # Clean up extra whitespace and improve formatting
-    content = re.sub(r'\n{3,}', '\n\n', content)
-    content = re.sub(r'<p>\s*</p>', '', content)  # Remove empty paragraphs
-    content = re.sub(r'<li>\s*</li>', '', content)  # Remove empty list items
+                if in_list:
+                    block.append('</ul>')
+                    in_list = False
+                # Blank lines separate paragraphs
+                if line:
+                    block.append(line)
+                else:
+                    flush_block()
 
-    return content
+        if in_list:
+            block.append('</ul>')
+        flush_block()
+
+        if i + 1 < len(parts):
+            write_block(format_code_block(parts[i + 1] or '', parts[i + 2]))
+
+    return out.getvalue()
 
 
 def replace_version_placeholders(content, version):
@@ -147,11 +166,12 @@ def replace_version_placeholders(content, version):
         return content
 
     # Replace x.y.z in dependency examples
-    content = re.sub(r'x\.y\.z', version, content)
+    content = content.replace('x.y.z', version)
 
-    # Also replace any other version placeholders
-    content = re.sub(r'\{version\}', version, content)
-    content = re.sub(r'\$\{version\}', version, content)
+    # Also replace any other version placeholders (${version} before {version}
+    # so the dollar sign is not left behind)
+    content = content.replace('${version}', version)
+    content = content.replace('{version}', version)
 
     return content
 
@@ -161,22 +181,20 @@ def main():
         print("Usage: python convert-readme.py <readme_file> <template_file> <output_file>")
         sys.exit(1)
 
-    readme_file = sys.argv[1]
-    template_file = sys.argv[2]
-    output_file = sys.argv[3]
+    readme_file = Path(sys.argv[1])
+    template_file = Path(sys.argv[2])
+    output_file = Path(sys.argv[3])
 
     # Read the README content
     try:
-        with open(readme_file, 'r', encoding='utf-8') as f:
-            readme_content = f.read()
+        readme_content = readme_file.read_text(encoding='utf-8')
     except FileNotFoundError:
         print(f"Error: README file '{readme_file}' not found")
         sys.exit(1)
 
     # Read the template
     try:
-        with open(template_file, 'r', encoding='utf-8') as f:
-            template_content = f.read()
+        template_content = template_file.read_text(encoding='utf-8')
     except FileNotFoundError:
         print(f"Error: Template file '{template_file}' not found")
         sys.exit(1)
@@ -193,12 +211,11 @@ def main():
     # Replace placeholders in template
     final_html = template_content.replace('{{CONTENT}}', readme_html)
     final_html = final_html.replace('{{VERSION}}', version)
-    final_html = final_html.replace('{{DATE}}', os.popen('date +"%Y-%m-%d"').read().strip())
+    final_html = final_html.replace('{{DATE}}', date.today().isoformat())
 
     # Write the output
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(final_html)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text(final_html, encoding='utf-8')
 
     print(f"Successfully converted {readme_file} to {output_file}")
     print(f"Version: {version}")
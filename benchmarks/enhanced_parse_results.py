@@ -4,204 +4,280 @@ import json
 import os
 import re
 import sys
-from collections import defaultdict
-from typing import Dict, Optional
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# JCacheX profiles mapping
+JCACHEX_PROFILES = {
+    'jcachexdefault': 'JCacheX-Default',
+    'jcachexreadheavy': 'JCacheX-ReadHeavy',
+    'jcachexwriteheavy': 'JCacheX-WriteHeavy',
+    'jcachexmemoryefficient': 'JCacheX-MemoryEfficient',
+    'jcachexhighperformance': 'JCacheX-HighPerformance',
+    'jcachexsessioncache': 'JCacheX-SessionCache',
+    'jcachexapicache': 'JCacheX-ApiCache',
+    'jcachexcomputecache': 'JCacheX-ComputeCache',
+    'jcachexmloptimized': 'JCacheX-MlOptimized',
+    'jcachexzerocopy': 'JCacheX-ZeroCopy',
+    'jcachexhardwareoptimized': 'JCacheX-HardwareOptimized',
+    'jcachexdistributed': 'JCacheX-Distributed'
+}
+
+# Lower-cased method name keyword -> cache implementation, in match priority order
+IMPLEMENTATION_KEYWORDS = list(JCACHEX_PROFILES.items()) + [
+    ('caffeine', 'Caffeine'),
+    ('ehcache', 'EhCache'),
+    ('cache2k', 'Cache2k'),
+    ('concurrentmap', 'ConcurrentHashMap'),
+    ('jcache', 'JCache'),
+]
+
+# Lower-cased method name keyword -> operation type, in match priority order
+OPERATION_KEYWORDS = [
+    ('extremecontention', 'EXTREME_CONTENTION'),
+    ('memorypressure', 'MEMORY_PRESSURE'),
+    ('zipfian', 'ZIPFIAN_ACCESS'),
+    ('evictionstress', 'EVICTION_STRESS'),
+    ('mixedread', 'MIXED_READ'),
+    ('mixedwrite', 'MIXED_WRITE'),
+    ('mixedremove', 'MIXED_REMOVE'),
+    ('sustainedload', 'SUSTAINED_LOAD'),
+    ('gcpressure', 'GC_PRESSURE'),
+    ('memoryleaktest', 'MEMORY_LEAK_TEST'),
+    ('burstload', 'BURST_LOAD'),
+    ('get', 'GET_LATENCY'),
+    ('put', 'PUT_LATENCY'),
+    ('remove', 'REMOVE_LATENCY'),
+    ('mixed', 'MIXED_THROUGHPUT'),
+    ('readheavy', 'READ_HEAVY'),
+    ('writeheavy', 'WRITE_HEAVY'),
+    ('highcontention', 'HIGH_CONTENTION'),
+]
+
+# Latency operations reported as throughput when the method name says so
+THROUGHPUT_OPERATIONS = {
+    'GET_LATENCY': 'GET_THROUGHPUT',
+    'PUT_LATENCY': 'PUT_THROUGHPUT',
+}
+
+
+def compile_priority_pattern(keywords: List[Tuple[str, str]]) -> re.Pattern:
+    """Compile keywords into one regex whose match.lastindex is the first listed keyword found.
+
+    Each alternative scans ahead for its own keyword and alternatives are tried
+    in order, so the result matches a chain of ``keyword in name`` checks rather
+    than picking whichever keyword occurs first in the name.
+    """
+    return re.compile('|'.join(f'.*?({re.escape(keyword)})' for keyword, _ in keywords))
+
+
+IMPLEMENTATION_PATTERN = compile_priority_pattern(IMPLEMENTATION_KEYWORDS)
+OPERATION_PATTERN = compile_priority_pattern(OPERATION_KEYWORDS)
+
+# Thread count patterns in priority order (regexes, matched against the lower-cased name)
+THREAD_COUNT_PATTERNS = [
+    (r'32t', 32), (r'16t', 16), (r'8t', 8), (r'4t', 4), (r'1t', 1),
+    (r'threads.*32', 32), (r'threads.*16', 16), (r'threads.*8', 8), (r'threads.*4', 4)
+]
+
+# Same priority trick as compile_priority_pattern; match.lastgroup names the pattern
+# that hit, with JMH thread annotations ("threads...N") as the last resort
+THREAD_COUNT_PATTERN = re.compile(
+    '|'.join(f'.*?(?P<t{index}>{pattern})' for index, (pattern, _) in enumerate(THREAD_COUNT_PATTERNS))
+    + r'|.*?threads.*?(?P<annotated>\d+)'
+)
+
+# Average latency (ns) upper bounds and the 0-10 rating for each band
+LATENCY_RATING_THRESHOLDS = [10, 50, 100, 500]
+LATENCY_RATINGS = [10.0, 8.0, 6.0, 4.0, 2.0]
+
+# Overall score lower bounds and the letter grade for each band
+PERFORMANCE_GRADE_THRESHOLDS = [50, 60, 70, 80, 90]
+PERFORMANCE_GRADES = ["D", "C", "B", "B+", "A", "A+"]
+
+# Weight of each suite in the overall score; hardcore and endurance share 10%
+SUITE_WEIGHTS = [
+    ('basic_operations', 0.3),
+    ('throughput', 0.4),
+    ('concurrent_operations', 0.2),
+    ('hardcore_stress', 0.05),
+    ('endurance_tests', 0.05),
+]
 
 
 class BenchmarkResult:
     """Represents a single benchmark result with enhanced metadata"""
+    __slots__ = ('benchmark_name', 'score', 'error', 'unit', 'suite_type', 'threads',
+                 'cache_impl', 'operation_type', 'operation_key')
+
     def __init__(self, benchmark_name: str, score: float, error: float, unit: str,
                  suite_type: str, threads: int = 1):
         self.benchmark_name = benchmark_name
         self.score = score
         self.error = error
-        self.unit = unit
-        self.suite_type = suite_type
+        # Units, suites and operation keys repeat across thousands of results;
+        # interning shares one string object per distinct value
+        self.unit = sys.intern(unit)
+        self.suite_type = sys.intern(suite_type)
         self.threads = threads
-        self.cache_impl = self._extract_cache_implementation()
-        self.operation_type = self._extract_operation_type()
-        self.operation_key = f"{self.operation_type}_{self.threads}T"
+        self.cache_impl, self.operation_type = self._classify(benchmark_name)
+        self.operation_key = sys.intern(f"{self.operation_type}_{self.threads}T")
 
-    def _extract_cache_implementation(self) -> str:
-        """Extract cache implementation from benchmark name"""
+    @staticmethod
+    def _classify(benchmark_name: str) -> Tuple[str, str]:
+        """Extract cache implementation and operation type from benchmark name"""
         # Extract method name from full benchmark path
-        method_name = self.benchmark_name.split('.')[-1].lower()
-
-        # JCacheX profiles mapping
-        jcachex_profiles = {
-            'jcachexdefault': 'JCacheX-Default',
-            'jcachexreadheavy': 'JCacheX-ReadHeavy',
-            'jcachexwriteheavy': 'JCacheX-WriteHeavy',
-            'jcachexmemoryefficient': 'JCacheX-MemoryEfficient',
-            'jcachexhighperformance': 'JCacheX-HighPerformance',
-            'jcachexsessioncache': 'JCacheX-SessionCache',
-            'jcachexapicache': 'JCacheX-ApiCache',
-            'jcachexcomputecache': 'JCacheX-ComputeCache',
-            'jcachexmloptimized': 'JCacheX-MlOptimized',
-            'jcachexzerocopy': 'JCacheX-ZeroCopy',
-            'jcachexhardwareoptimized': 'JCacheX-HardwareOptimized',
-            'jcachexdistributed': 'JCacheX-Distributed'
-        }
+        method_name = benchmark_name.rpartition('.')[2].lower()
+
+        match = IMPLEMENTATION_PATTERN.match(method_name)
+        cache_impl = IMPLEMENTATION_KEYWORDS[match.lastindex - 1][1] if match else 'Unknown'
+
+        match = OPERATION_PATTERN.match(method_name)
+        if not match:
+            return cache_impl, 'UNKNOWN'
+
+        operation_type = OPERATION_KEYWORDS[match.lastindex - 1][1]
+        if 'throughput' in method_name:
+            operation_type = THROUGHPUT_OPERATIONS.get(operation_type, operation_type)
+        return cache_impl, operation_type
+
+
+def _iter_results(results_file):
+    """Iterate over the benchmark records of an open JMH JSON results file"""
+    if ijson is not None:
+        # Stream one record at a time instead of materializing the whole array
+        return ijson.items(results_file, 'item')
+    if orjson is not None:
+        return orjson.loads(results_file.read())
+    return json.load(results_file)
+
+
+def _parse_record(result: Dict, suite_type: str) -> BenchmarkResult:
+    """Build a BenchmarkResult from one JMH JSON record"""
+    benchmark_name = result['benchmark']
+
+    # Safely extract and convert score and error to float
+    try:
+        score = float(result['primaryMetric']['score'])
+        # Convert ops/ns to ops/s for throughput benchmarks
+        if result['primaryMetric']['scoreUnit'] == 'ops/ns':
+            score = score * 1000000000  # Convert to ops/s
+    except (ValueError, TypeError, KeyError):
+        score = 0.0
+
+    try:
+        error = float(result['primaryMetric']['scoreError'])
+        # Convert ops/ns to ops/s for throughput benchmarks
+        if result['primaryMetric']['scoreUnit'] == 'ops/ns':
+            error = error * 1000000000  # Convert to ops/s
+    except (ValueError, TypeError, KeyError):
+        error = 0.0
+
+    unit = result['primaryMetric']['scoreUnit']
+    # Update unit display for converted values
+    if unit == 'ops/ns':
+        unit = 'ops/s'
+
+    # Extract thread count from JMH result
+    threads = result.get('threads', 1)
+
+    # Create enhanced result object
+    return BenchmarkResult(
+        benchmark_name=benchmark_name,
+        score=score,
+        error=error,
+        unit=unit,
+        suite_type=suite_type,
+        threads=threads
+    )
+
+
+def _parse_file(path: str, suite_type: str) -> List[BenchmarkResult]:
+    """Parse results for a specific benchmark suite file"""
+    suite_results = []
+
+    try:
+        with open(path, 'rb') as f:
+            for result in _iter_results(f):
+                try:
+                    suite_results.append(_parse_record(result, suite_type))
+                except Exception as e:
+                    # A malformed record ends the file but keeps the records before it
+                    print(f"Error parsing {os.path.basename(path)}: {e}", file=sys.stderr)
+                    return suite_results
+
+    except Exception as e:
+        # Undecodable JSON is dropped entirely, even when streaming had yielded records
+        print(f"Error parsing {os.path.basename(path)}: {e}", file=sys.stderr)
+        return []
+
+    return suite_results
 
-        # Check JCacheX profiles
-        for key, value in jcachex_profiles.items():
-            if key in method_name:
-                return value
-
-        # Check other implementations
-        if 'caffeine' in method_name:
-            return 'Caffeine'
-        elif 'ehcache' in method_name:
-            return 'EhCache'
-        elif 'cache2k' in method_name:
-            return 'Cache2k'
-        elif 'concurrentmap' in method_name:
-            return 'ConcurrentHashMap'
-        elif 'jcache' in method_name:
-            return 'JCache'
-
-        return 'Unknown'
-
-    def _extract_operation_type(self) -> str:
-        """Extract operation type from benchmark name"""
-        method_name = self.benchmark_name.split('.')[-1].lower()
-
-        # Determine operation type with enhanced pattern matching
-        if 'extremecontention' in method_name:
-            return 'EXTREME_CONTENTION'
-        elif 'memorypressure' in method_name:
-            return 'MEMORY_PRESSURE'
-        elif 'zipfian' in method_name:
-            return 'ZIPFIAN_ACCESS'
-        elif 'evictionstress' in method_name:
-            return 'EVICTION_STRESS'
-        elif 'mixedread' in method_name:
-            return 'MIXED_READ'
-        elif 'mixedwrite' in method_name:
-            return 'MIXED_WRITE'
-        elif 'mixedremove' in method_name:
-            return 'MIXED_REMOVE'
-        elif 'sustainedload' in method_name:
-            return 'SUSTAINED_LOAD'
-        elif 'gcpressure' in method_name:
-            return 'GC_PRESSURE'
-        elif 'memoryleaktest' in method_name:
-            return 'MEMORY_LEAK_TEST'
-        elif 'burstload' in method_name:
-            return 'BURST_LOAD'
-        elif 'get' in method_name:
-            if 'throughput' in method_name:
-                return 'GET_THROUGHPUT'
-            else:
-                return 'GET_LATENCY'
-        elif 'put' in method_name:
-            if 'throughput' in method_name:
-                return 'PUT_THROUGHPUT'
-            else:
-                return 'PUT_LATENCY'
-        elif 'remove' in method_name:
-            return 'REMOVE_LATENCY'
-        elif 'mixed' in method_name:
-            return 'MIXED_THROUGHPUT'
-        elif 'readheavy' in method_name:
-            return 'READ_HEAVY'
-        elif 'writeheavy' in method_name:
-            return 'WRITE_HEAVY'
-        elif 'highcontention' in method_name:
-            return 'HIGH_CONTENTION'
-
-        return 'UNKNOWN'
 
 class EnhancedBenchmarkParser:
     """Enhanced benchmark results parser with comprehensive analysis"""
 
     def __init__(self, results_dir: str):
         self.results_dir = results_dir
-        self.results = defaultdict(lambda: defaultdict(lambda: defaultdict(dict)))
+        # Flat store keyed by (suite_type, cache_impl, operation_key)
+        self.results: Dict[Tuple[str, str, str], BenchmarkResult] = {}
         self.suite_types = ['basic_operations', 'throughput', 'concurrent_operations',
                            'hardcore_stress', 'endurance_tests']
 
     def parse_all_results(self) -> Dict:
         """Parse all benchmark results with enhanced categorization"""
 
-        for filename in os.listdir(self.results_dir):
-            if filename.endswith('_results.json'):
-                suite_type = filename.replace('_results.json', '')
-                self._parse_suite_results(filename, suite_type)
-
-        return self.results
-
-    def _parse_suite_results(self, filename: str, suite_type: str):
-        """Parse results for a specific benchmark suite"""
-
-        try:
-            with open(os.path.join(self.results_dir, filename), 'r') as f:
-                data = json.load(f)
-
-            for result in data:
-                benchmark_name = result['benchmark']
-
-                # Safely extract and convert score and error to float
-                try:
-                    score = float(result['primaryMetric']['score'])
-                    # Convert ops/ns to ops/s for throughput benchmarks
-                    if result['primaryMetric']['scoreUnit'] == 'ops/ns':
-                        score = score * 1000000000  # Convert to ops/s
-                except (ValueError, TypeError, KeyError):
-                    score = 0.0
-
-                try:
-                    error = float(result['primaryMetric']['scoreError'])
-                    # Convert ops/ns to ops/s for throughput benchmarks
-                    if result['primaryMetric']['scoreUnit'] == 'ops/ns':
-                        error = error * 1000000000  # Convert to ops/s
-                except (ValueError, TypeError, KeyError):
-                    error = 0.0
-
-                unit = result['primaryMetric']['scoreUnit']
-                # Update unit display for converted values
-                if unit == 'ops/ns':
-                    unit = 'ops/s'
-
-                                # Extract thread count from JMH result
-                threads = result.get('threads', 1)
-
-                # Create enhanced result object
-                benchmark_result = BenchmarkResult(
-                    benchmark_name=benchmark_name,
-                    score=score,
-                    error=error,
-                    unit=unit,
-                    suite_type=suite_type,
-                    threads=threads
-                )
-
-                # Store in nested structure: suite -> cache_impl -> operation_key
-                self.results[suite_type][benchmark_result.cache_impl][benchmark_result.operation_key] = benchmark_result
-
-        except Exception as e:
-            print(f"Error parsing {filename}: {e}", file=sys.stderr)
+        paths = []
+        suite_types = []
+        with os.scandir(self.results_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('_results.json'):
+                    paths.append(entry.path)
+                    suite_types.append(entry.name.replace('_results.json', ''))
+
+        # Suite files are independent, so decode and classify them on separate cores
+        with ProcessPoolExecutor(max_workers=max(1, min(len(paths), os.cpu_count() or 1))) as executor:
+            for suite_type, suite_results in zip(suite_types, executor.map(_parse_file, paths, suite_types)):
+                for benchmark_result in suite_results:
+                    # Unpickling from the worker yields fresh string copies; intern them again
+                    benchmark_result.unit = sys.intern(benchmark_result.unit)
+                    benchmark_result.suite_type = sys.intern(benchmark_result.suite_type)
+                    benchmark_result.cache_impl = sys.intern(benchmark_result.cache_impl)
+                    benchmark_result.operation_type = sys.intern(benchmark_result.operation_type)
+                    benchmark_result.operation_key = sys.intern(benchmark_result.operation_key)
+                    key = (suite_type, benchmark_result.cache_impl, benchmark_result.operation_key)
+                    self.results[key] = benchmark_result
+
+        return self.group_results()
+
+    def group_results(self) -> Dict[str, Dict[str, Dict[str, BenchmarkResult]]]:
+        """Build the suite -> cache_impl -> operation_key view of the parsed results"""
+        grouped = {}
+        for (suite_type, cache_impl, operation_key), benchmark_result in self.results.items():
+            grouped.setdefault(suite_type, {}).setdefault(cache_impl, {})[operation_key] = benchmark_result
+        return grouped
 
     def _extract_thread_count(self, benchmark_name: str) -> int:
         """Extract thread count from benchmark name"""
-        # Look for thread count patterns
-        thread_patterns = [
-            (r'32t', 32), (r'16t', 16), (r'8t', 8), (r'4t', 4), (r'1t', 1),
-            (r'threads.*32', 32), (r'threads.*16', 16), (r'threads.*8', 8), (r'threads.*4', 4)
-        ]
-
-        name_lower = benchmark_name.lower()
-        for pattern, count in thread_patterns:
-            if re.search(pattern, name_lower):
-                return count
-
-        # Check JMH thread annotations in the benchmark name
-        if 'threads' in name_lower:
-            match = re.search(r'threads.*?(\d+)', name_lower)
-            if match:
-                return int(match.group(1))
-
-        return 1  # Default to single-threaded
+        match = THREAD_COUNT_PATTERN.match(benchmark_name.lower())
+        if not match:
+            return 1  # Default to single-threaded
+        if match.lastgroup == 'annotated':
+            return int(match.group('annotated'))
+        return THREAD_COUNT_PATTERNS[int(match.lastgroup[1:])][1]
 
 class ComprehensiveResultsAnalyzer:
     """Comprehensive analyzer for benchmark results with advanced metrics"""
@@ -222,6 +298,17 @@ class ComprehensiveResultsAnalyzer:
             "Caffeine", "EhCache", "Cache2k", "ConcurrentHashMap", "JCache"
         ]
 
+        # Inverted index built once: suite -> cache_impl -> (operation_type, threads) -> score,
+        # kept in operation key insertion order so fallback scans pick the same entry
+        self.scores = {}
+        for suite_type, suite_results in results.items():
+            suite_scores = self.scores[suite_type] = {}
+            for cache_impl, cache_data in suite_results.items():
+                suite_scores[cache_impl] = {
+                    (benchmark_result.operation_type, benchmark_result.threads): benchmark_result.score
+                    for benchmark_result in cache_data.values()
+                }
+
     def generate_comprehensive_report(self):
         """Generate comprehensive benchmark report"""
 
@@ -274,9 +361,9 @@ class ComprehensiveResultsAnalyzer:
         print("=" * 90)
 
         if suite_type == 'throughput':
-            self._generate_throughput_table(suite_results)
+            self._generate_throughput_table(self.scores[suite_type])
         elif suite_type == 'basic_operations':
-            self._generate_latency_table(suite_results)
+            self._generate_latency_table(self.scores[suite_type])
         elif suite_type == 'concurrent_operations':
             self._generate_concurrent_table(suite_results)
         elif suite_type == 'hardcore_stress':
@@ -286,85 +373,64 @@ class ComprehensiveResultsAnalyzer:
 
         print()
 
-    def _generate_throughput_table(self, suite_results: Dict):
+    def _generate_throughput_table(self, suite_scores: Dict):
         """Generate thread-aware throughput table"""
 
-        print(f"{'Cache Implementation':<25} {'1T Throughput':<15} {'4T Throughput':<15} {'Scaling':<10} {'Efficiency':<12}")
-        print("-" * 90)
+        rows = []
+        rows.append(f"{'Cache Implementation':<25} {'1T Throughput':<15} {'4T Throughput':<15} {'Scaling':<10} {'Efficiency':<12}")
+        rows.append("-" * 90)
 
         for cache_impl in self.cache_implementations:
-            if cache_impl in suite_results:
-                cache_data = suite_results[cache_impl]
-
-                # Get throughput for different thread counts
-                # Try different operation keys that might exist
-                throughput_1t = None
-                throughput_4t = None
-
-                # Look for GET throughput operations
-                for op_key in cache_data.keys():
-                    if 'GET_THROUGHPUT' in op_key and '_1T' in op_key:
-                        throughput_1t = cache_data[op_key].score
-                    elif 'GET_THROUGHPUT' in op_key and '_4T' in op_key:
-                        throughput_4t = cache_data[op_key].score
-
-                # If no GET throughput found, try any throughput operation
-                if not throughput_1t:
-                    for op_key in cache_data.keys():
-                        if 'THROUGHPUT' in op_key and '_1T' in op_key:
-                            throughput_1t = cache_data[op_key].score
-                            break
-
-                if not throughput_4t:
-                    for op_key in cache_data.keys():
-                        if 'THROUGHPUT' in op_key and '_4T' in op_key:
-                            throughput_4t = cache_data[op_key].score
-                            break
-
-                # Calculate scaling factor
-                scaling_factor = "N/A"
-                efficiency = "N/A"
-
-                if throughput_1t and throughput_4t and throughput_1t > 0:
-                    scaling = throughput_4t / throughput_1t
-                    efficiency_pct = (scaling / 4.0) * 100  # Theoretical max is 4x
-                    scaling_factor = f"{scaling:.2f}x"
-                    efficiency = f"{efficiency_pct:.1f}%"
-
-                # Format throughput values
-                throughput_1t_str = f"{throughput_1t/1000000:.1f}M" if throughput_1t else "N/A"
-                throughput_4t_str = f"{throughput_4t/1000000:.1f}M" if throughput_4t else "N/A"
-
-                print(f"{cache_impl:<25} {throughput_1t_str:<15} {throughput_4t_str:<15} {scaling_factor:<10} {efficiency:<12}")
+            impl_scores = suite_scores.get(cache_impl)
+            if impl_scores is None:
+                continue
 
-        print()
+            # Get throughput for different thread counts, preferring GET
+            # throughput and falling back to any throughput operation
+            throughput_1t = impl_scores.get(('GET_THROUGHPUT', 1)) or self._find_throughput_score(impl_scores, 1)
+            throughput_4t = impl_scores.get(('GET_THROUGHPUT', 4)) or self._find_throughput_score(impl_scores, 4)
 
-    def _generate_latency_table(self, suite_results: Dict):
+            # Calculate scaling factor
+            scaling_factor = "N/A"
+            efficiency = "N/A"
+
+            if throughput_1t and throughput_4t and throughput_1t > 0:
+                scaling = throughput_4t / throughput_1t
+                efficiency_pct = (scaling / 4.0) * 100  # Theoretical max is 4x
+                scaling_factor = f"{scaling:.2f}x"
+                efficiency = f"{efficiency_pct:.1f}%"
+
+            # Format throughput values
+            throughput_1t_str = f"{throughput_1t/1000000:.1f}M" if throughput_1t else "N/A"
+            throughput_4t_str = f"{throughput_4t/1000000:.1f}M" if throughput_4t else "N/A"
+
+            rows.append(f"{cache_impl:<25} {throughput_1t_str:<15} {throughput_4t_str:<15} {scaling_factor:<10} {efficiency:<12}")
+
+        rows.append("")
+        sys.stdout.write("\n".join(rows) + "\n")
+
+    def _generate_latency_table(self, suite_scores: Dict):
         """Generate latency analysis table"""
 
-        print(f"{'Cache Implementation':<25} {'GET Latency':<12} {'PUT Latency':<12} {'Performance':<12}")
-        print("-" * 70)
+        rows = []
+        rows.append(f"{'Cache Implementation':<25} {'GET Latency':<12} {'PUT Latency':<12} {'Performance':<12}")
+        rows.append("-" * 70)
 
         latency_data = []
 
         for cache_impl in self.cache_implementations:
-            if cache_impl in suite_results:
-                cache_data = suite_results[cache_impl]
+            impl_scores = suite_scores.get(cache_impl)
+            if impl_scores is None:
+                continue
 
-                # Look for GET and PUT latency operations
-                get_latency = None
-                put_latency = None
+            # Look for GET and PUT latency operations
+            get_latency = self._last_score(impl_scores, 'GET_LATENCY')
+            put_latency = self._last_score(impl_scores, 'PUT_LATENCY')
 
-                for op_key in cache_data.keys():
-                    if 'GET_LATENCY' in op_key:
-                        get_latency = cache_data[op_key].score
-                    elif 'PUT_LATENCY' in op_key:
-                        put_latency = cache_data[op_key].score
+            # Calculate performance rating
+            performance = self._calculate_performance_rating(get_latency, put_latency)
 
-                # Calculate performance rating
-                performance = self._calculate_performance_rating(get_latency, put_latency)
-
-                latency_data.append((cache_impl, get_latency, put_latency, performance))
+            latency_data.append((cache_impl, get_latency, put_latency, performance))
 
         # Sort by performance (lower latency is better)
         latency_data.sort(key=lambda x: x[3] if x[3] else 0, reverse=True)
@@ -374,75 +440,85 @@ class ComprehensiveResultsAnalyzer:
             put_str = f"{put_latency:.1f}ns" if put_latency else "N/A"
             perf_str = f"{performance:.1f}/10" if performance else "N/A"
 
-            print(f"{cache_impl:<25} {get_str:<12} {put_str:<12} {perf_str:<12}")
+            rows.append(f"{cache_impl:<25} {get_str:<12} {put_str:<12} {perf_str:<12}")
 
-        print()
+        rows.append("")
+        sys.stdout.write("\n".join(rows) + "\n")
 
     def _generate_concurrent_table(self, suite_results: Dict):
         """Generate concurrent operations analysis"""
 
-        print(f"{'Cache Implementation':<25} {'Read-Heavy':<12} {'Write-Heavy':<12} {'High-Contention':<15}")
-        print("-" * 70)
+        rows = []
+        rows.append(f"{'Cache Implementation':<25} {'Read-Heavy':<12} {'Write-Heavy':<12} {'High-Contention':<15}")
+        rows.append("-" * 70)
 
         for cache_impl in self.cache_implementations:
-            if cache_impl in suite_results:
-                cache_data = suite_results[cache_impl]
+            cache_data = suite_results.get(cache_impl)
+            if cache_data is None:
+                continue
 
-                read_heavy = self._get_throughput_score(cache_data, 'READ_HEAVY_1T')
-                write_heavy = self._get_throughput_score(cache_data, 'WRITE_HEAVY_1T')
-                high_contention = self._get_throughput_score(cache_data, 'HIGH_CONTENTION_1T')
+            read_heavy = self._get_throughput_score(cache_data, 'READ_HEAVY_1T')
+            write_heavy = self._get_throughput_score(cache_data, 'WRITE_HEAVY_1T')
+            high_contention = self._get_throughput_score(cache_data, 'HIGH_CONTENTION_1T')
 
-                read_str = f"{read_heavy/1000000:.1f}M" if read_heavy else "N/A"
-                write_str = f"{write_heavy/1000000:.1f}M" if write_heavy else "N/A"
-                contention_str = f"{high_contention/1000000:.1f}M" if high_contention else "N/A"
+            read_str = f"{read_heavy/1000000:.1f}M" if read_heavy else "N/A"
+            write_str = f"{write_heavy/1000000:.1f}M" if write_heavy else "N/A"
+            contention_str = f"{high_contention/1000000:.1f}M" if high_contention else "N/A"
 
-                print(f"{cache_impl:<25} {read_str:<12} {write_str:<12} {contention_str:<15}")
+            rows.append(f"{cache_impl:<25} {read_str:<12} {write_str:<12} {contention_str:<15}")
 
-        print()
+        rows.append("")
+        sys.stdout.write("\n".join(rows) + "\n")
 
     def _generate_hardcore_table(self, suite_results: Dict):
         """Generate hardcore stress test analysis"""
 
-        print(f"{'Cache Implementation':<25} {'Extreme Threads':<15} {'Memory Pressure':<15} {'Eviction Stress':<15}")
-        print("-" * 75)
+        rows = []
+        rows.append(f"{'Cache Implementation':<25} {'Extreme Threads':<15} {'Memory Pressure':<15} {'Eviction Stress':<15}")
+        rows.append("-" * 75)
 
         for cache_impl in self.cache_implementations:
-            if cache_impl in suite_results:
-                cache_data = suite_results[cache_impl]
+            cache_data = suite_results.get(cache_impl)
+            if cache_data is None:
+                continue
 
-                extreme_contention = self._get_throughput_score(cache_data, 'EXTREME_CONTENTION_32T')
-                memory_pressure = self._get_throughput_score(cache_data, 'MEMORY_PRESSURE_8T')
-                eviction_stress = self._get_throughput_score(cache_data, 'EVICTION_STRESS_16T')
+            extreme_contention = self._get_throughput_score(cache_data, 'EXTREME_CONTENTION_32T')
+            memory_pressure = self._get_throughput_score(cache_data, 'MEMORY_PRESSURE_8T')
+            eviction_stress = self._get_throughput_score(cache_data, 'EVICTION_STRESS_16T')
 
-                extreme_str = f"{extreme_contention/1000000:.1f}M" if extreme_contention else "N/A"
-                memory_str = f"{memory_pressure/1000000:.1f}M" if memory_pressure else "N/A"
-                eviction_str = f"{eviction_stress/1000000:.1f}M" if eviction_stress else "N/A"
+            extreme_str = f"{extreme_contention/1000000:.1f}M" if extreme_contention else "N/A"
+            memory_str = f"{memory_pressure/1000000:.1f}M" if memory_pressure else "N/A"
+            eviction_str = f"{eviction_stress/1000000:.1f}M" if eviction_stress else "N/A"
 
-                print(f"{cache_impl:<25} {extreme_str:<15} {memory_str:<15} {eviction_str:<15}")
+            rows.append(f"{cache_impl:<25} {extreme_str:<15} {memory_str:<15} {eviction_str:<15}")
 
-        print()
+        rows.append("")
+        sys.stdout.write("\n".join(rows) + "\n")
 
     def _generate_endurance_table(self, suite_results: Dict):
         """Generate endurance test analysis"""
 
-        print(f"{'Cache Implementation':<25} {'Sustained Load':<15} {'GC Pressure':<12} {'Memory Stability':<16}")
-        print("-" * 75)
+        rows = []
+        rows.append(f"{'Cache Implementation':<25} {'Sustained Load':<15} {'GC Pressure':<12} {'Memory Stability':<16}")
+        rows.append("-" * 75)
 
         for cache_impl in self.cache_implementations:
-            if cache_impl in suite_results:
-                cache_data = suite_results[cache_impl]
+            cache_data = suite_results.get(cache_impl)
+            if cache_data is None:
+                continue
 
-                sustained_load = self._get_throughput_score(cache_data, 'SUSTAINED_LOAD_8T')
-                gc_pressure = self._get_throughput_score(cache_data, 'GC_PRESSURE_6T')
-                memory_stability = self._get_throughput_score(cache_data, 'MEMORY_LEAK_TEST_4T')
+            sustained_load = self._get_throughput_score(cache_data, 'SUSTAINED_LOAD_8T')
+            gc_pressure = self._get_throughput_score(cache_data, 'GC_PRESSURE_6T')
+            memory_stability = self._get_throughput_score(cache_data, 'MEMORY_LEAK_TEST_4T')
 
-                sustained_str = f"{sustained_load/1000000:.1f}M" if sustained_load else "N/A"
-                gc_str = f"{gc_pressure/1000000:.1f}M" if gc_pressure else "N/A"
-                memory_str = f"{memory_stability/1000000:.1f}M" if memory_stability else "N/A"
+            sustained_str = f"{sustained_load/1000000:.1f}M" if sustained_load else "N/A"
+            gc_str = f"{gc_pressure/1000000:.1f}M" if gc_pressure else "N/A"
+            memory_str = f"{memory_stability/1000000:.1f}M" if memory_stability else "N/A"
 
-                print(f"{cache_impl:<25} {sustained_str:<15} {gc_str:<12} {memory_str:<16}")
+            rows.append(f"{cache_impl:<25} {sustained_str:<15} {gc_str:<12} {memory_str:<16}")
 
-        print()
+        rows.append("")
+        sys.stdout.write("\n".join(rows) + "\n")
 
     def _generate_cross_suite_comparison(self):
         """Generate cross-suite performance comparison"""
@@ -459,7 +535,7 @@ class ComprehensiveResultsAnalyzer:
                 overall_scores[cache_impl] = score
 
         # Sort by overall score
-        sorted_scores = sorted(overall_scores.items(), key=lambda x: x[1], reverse=True)
+        sorted_scores = sorted(overall_scores.items(), key=itemgetter(1), reverse=True)
 
         print(f"{'Rank':<5} {'Cache Implementation':<25} {'Overall Score':<15} {'Grade':<8}")
         print("-" * 60)
@@ -518,26 +594,38 @@ class ComprehensiveResultsAnalyzer:
         # Calculate CPU utilization efficiency
         print("⚙️ CPU Utilization Efficiency:")
 
-        if 'throughput' in self.results:
-            for cache_impl in ['JCacheX-Default', 'Caffeine', 'ConcurrentHashMap']:
-                if cache_impl in self.results['throughput']:
-                    efficiency = self._calculate_cpu_efficiency(cache_impl)
-                    print(f"  • {cache_impl}: {efficiency}")
+        throughput_results = self.results.get('throughput', {})
+        for cache_impl in ['JCacheX-Default', 'Caffeine', 'ConcurrentHashMap']:
+            if cache_impl in throughput_results:
+                efficiency = self._calculate_cpu_efficiency(cache_impl)
+                print(f"  • {cache_impl}: {efficiency}")
 
         print()
 
     # Helper methods
+    def _find_throughput_score(self, impl_scores: Dict, threads: int) -> Optional[float]:
+        """Get the score of the first throughput operation measured with the given thread count"""
+        for (operation_type, op_threads), score in impl_scores.items():
+            if op_threads == threads and 'THROUGHPUT' in operation_type:
+                return score
+        return None
+
+    def _last_score(self, impl_scores: Dict, operation_type: str) -> Optional[float]:
+        """Get the most recently recorded score for an operation type, whatever its thread count"""
+        for (op_type, _), score in reversed(impl_scores.items()):
+            if op_type == operation_type:
+                return score
+        return None
+
     def _get_throughput_score(self, cache_data: Dict, operation_key: str) -> Optional[float]:
         """Get throughput score for a specific operation"""
-        if operation_key in cache_data:
-            return cache_data[operation_key].score
-        return None
+        benchmark_result = cache_data.get(operation_key)
+        return benchmark_result.score if benchmark_result is not None else None
 
     def _get_latency_score(self, cache_data: Dict, operation_key: str) -> Optional[float]:
         """Get latency score for a specific operation"""
-        if operation_key in cache_data:
-            return cache_data[operation_key].score
-        return None
+        benchmark_result = cache_data.get(operation_key)
+        return benchmark_result.score if benchmark_result is not None else None
 
     def _calculate_performance_rating(self, get_latency: Optional[float], put_latency: Optional[float]) -> Optional[float]:
         """Calculate performance rating (0-10 scale)"""
@@ -547,78 +635,35 @@ class ComprehensiveResultsAnalyzer:
         # Performance rating based on latency (lower is better)
         # Scale: < 10ns = 10/10, < 50ns = 8/10, < 100ns = 6/10, etc.
         avg_latency = (get_latency + put_latency) / 2
-
-        if avg_latency < 10:
-            return 10.0
-        elif avg_latency < 50:
-            return 8.0
-        elif avg_latency < 100:
-            return 6.0
-        elif avg_latency < 500:
-            return 4.0
-        else:
-            return 2.0
+        return LATENCY_RATINGS[bisect_right(LATENCY_RATING_THRESHOLDS, avg_latency)]
 
     def _calculate_overall_score(self, cache_impl: str) -> Optional[float]:
         """Calculate overall performance score across all suites"""
         scores = []
-
-        # Basic operations weight: 30%
-        if 'basic_operations' in self.results and cache_impl in self.results['basic_operations']:
-            basic_score = self._calculate_suite_score(cache_impl, 'basic_operations')
-            if basic_score:
-                scores.append(basic_score * 0.3)
-
-        # Throughput weight: 40%
-        if 'throughput' in self.results and cache_impl in self.results['throughput']:
-            throughput_score = self._calculate_suite_score(cache_impl, 'throughput')
-            if throughput_score:
-                scores.append(throughput_score * 0.4)
-
-        # Concurrent operations weight: 20%
-        if 'concurrent_operations' in self.results and cache_impl in self.results['concurrent_operations']:
-            concurrent_score = self._calculate_suite_score(cache_impl, 'concurrent_operations')
-            if concurrent_score:
-                scores.append(concurrent_score * 0.2)
-
-        # Hardcore/Endurance weight: 10%
-        hardcore_score = 0
-        if 'hardcore_stress' in self.results and cache_impl in self.results['hardcore_stress']:
-            hardcore_score += self._calculate_suite_score(cache_impl, 'hardcore_stress') or 0
-        if 'endurance_tests' in self.results and cache_impl in self.results['endurance_tests']:
-            hardcore_score += self._calculate_suite_score(cache_impl, 'endurance_tests') or 0
-
-        if hardcore_score > 0:
-            scores.append((hardcore_score / 2) * 0.1)
+        for suite_type, weight in SUITE_WEIGHTS:
+            cache_data = self.results.get(suite_type, {}).get(cache_impl)
+            if cache_data is not None:
+                suite_score = self._calculate_suite_score(suite_type, cache_data)
+                if suite_score:
+                    scores.append(suite_score * weight)
 
         return sum(scores) if scores else None
 
-    def _calculate_suite_score(self, cache_impl: str, suite_type: str) -> Optional[float]:
+    def _calculate_suite_score(self, suite_type: str, cache_data: Dict) -> Optional[float]:
         """Calculate score for a specific suite"""
         # This is a simplified scoring system - can be enhanced
         if suite_type == 'throughput':
-            throughput_1t = self._get_throughput_score(self.results[suite_type][cache_impl], 'GET_THROUGHPUT_1T')
+            throughput_1t = self._get_throughput_score(cache_data, 'GET_THROUGHPUT_1T')
             return min(throughput_1t / 1000000, 100) if throughput_1t else None
         elif suite_type == 'basic_operations':
-            get_latency = self._get_latency_score(self.results[suite_type][cache_impl], 'GET_LATENCY_1T')
+            get_latency = self._get_latency_score(cache_data, 'GET_LATENCY_1T')
             return max(0, 100 - get_latency) if get_latency else None
 
         return 50.0  # Default score
 
     def _get_performance_grade(self, score: float) -> str:
         """Convert score to letter grade"""
-        if score >= 90:
-            return "A+"
-        elif score >= 80:
-            return "A"
-        elif score >= 70:
-            return "B+"
-        elif score >= 60:
-            return "B"
-        elif score >= 50:
-            return "C"
-        else:
-            return "D"
+        return PERFORMANCE_GRADES[bisect_right(PERFORMANCE_GRADE_THRESHOLDS, score)]
 
     def _find_best_performer(self, category: str) -> str:
         """Find best performer in a specific category"""
@@ -665,9 +710,9 @@ def main():
     config_file = os.path.join(results_dir, 'test_config.txt')
     if os.path.exists(config_file):
         with open(config_file, 'r') as f:
-            for line in f:
-                if ':' in line:
-                    key, value = line.strip().split(':', 1)
+            for line in f.read().splitlines():
+                key, sep, value = line.partition(':')
+                if sep:
                     test_config[key.strip()] = value.strip()
 
     # Generate comprehensive analysis
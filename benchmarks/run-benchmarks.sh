@@ -181,10 +181,45 @@ parse_results() {
     # Create Python script to parse JSON results
     cat > "$results_dir/parse_results.py" << 'EOF'
 import json
+import re
 import sys
 import os
 from collections import defaultdict
 
+# Benchmark method keyword -> cache implementation, in match priority order
+CACHE_IMPL_KEYWORDS = [
+    ('jcacheXDefault', "JCacheX-Default"),
+    ('jcacheXReadHeavy', "JCacheX-ReadHeavy"),
+    ('jcacheXWriteHeavy', "JCacheX-WriteHeavy"),
+    ('jcacheXMemoryEfficient', "JCacheX-MemoryEfficient"),
+    ('jcacheXHighPerformance', "JCacheX-HighPerformance"),
+    ('jcacheXSessionCache', "JCacheX-SessionCache"),
+    ('jcacheXApiCache', "JCacheX-ApiCache"),
+    ('jcacheXComputeCache', "JCacheX-ComputeCache"),
+    ('jcacheXMlOptimized', "JCacheX-MlOptimized"),
+    ('jcacheXZeroCopy', "JCacheX-ZeroCopy"),
+    ('jcacheXHardwareOptimized', "JCacheX-HardwareOptimized"),
+    ('jcacheXDistributed', "JCacheX-Distributed"),
+    ('(?i:caffeine)', "Caffeine"),
+    ('(?i:ehcache)', "EhCache"),
+    ('(?i:cache2k)', "Cache2k"),
+    ('concurrentMap', "ConcurrentHashMap"),
+]
+
+# Lower-cased keyword -> (latency operation, throughput operation), in match priority order
+OPERATION_KEYWORDS = [
+    ('get', "GET_LATENCY", "GET_THROUGHPUT"),
+    ('put', "PUT_LATENCY", "PUT_THROUGHPUT"),
+    ('mixed', "MIXED_THROUGHPUT", "MIXED_THROUGHPUT"),
+]
+
+def priority_pattern(keywords):
+    """Compile keywords into one regex whose match.lastindex is the first listed keyword found"""
+    return re.compile('|'.join(f'.*?({entry[0]})' for entry in keywords))
+
+CACHE_IMPL_RE = priority_pattern(CACHE_IMPL_KEYWORDS)
+OPERATION_RE = priority_pattern(OPERATION_KEYWORDS)
+
 def parse_jmh_results(results_dir):
     """Parse JMH JSON results and extract key metrics"""
 
@@ -220,55 +255,16 @@ def parse_jmh_results(results_dir):
                     parts = benchmark_name.split('.')[-1]  # Get method name
 
                     # Determine cache implementation
-                    cache_impl = "Unknown"
-                    if 'jcacheXDefault' in parts:
-                        cache_impl = "JCacheX-Default"
-                    elif 'jcacheXReadHeavy' in parts:
-                        cache_impl = "JCacheX-ReadHeavy"
-                    elif 'jcacheXWriteHeavy' in parts:
-                        cache_impl = "JCacheX-WriteHeavy"
-                    elif 'jcacheXMemoryEfficient' in parts:
-                        cache_impl = "JCacheX-MemoryEfficient"
-                    elif 'jcacheXHighPerformance' in parts:
-                        cache_impl = "JCacheX-HighPerformance"
-                    elif 'jcacheXSessionCache' in parts:
-                        cache_impl = "JCacheX-SessionCache"
-                    elif 'jcacheXApiCache' in parts:
-                        cache_impl = "JCacheX-ApiCache"
-                    elif 'jcacheXComputeCache' in parts:
-                        cache_impl = "JCacheX-ComputeCache"
-                    elif 'jcacheXMlOptimized' in parts:
-                        cache_impl = "JCacheX-MlOptimized"
-                    elif 'jcacheXZeroCopy' in parts:
-                        cache_impl = "JCacheX-ZeroCopy"
-                    elif 'jcacheXHardwareOptimized' in parts:
-                        cache_impl = "JCacheX-HardwareOptimized"
-                    elif 'jcacheXDistributed' in parts:
-                        cache_impl = "JCacheX-Distributed"
-                    elif 'caffeine' in parts.lower():
-                        cache_impl = "Caffeine"
-                    elif 'ehcache' in parts.lower():
-                        cache_impl = "EhCache"
-                    elif 'cache2k' in parts.lower():
-                        cache_impl = "Cache2k"
-                    elif 'concurrentMap' in parts:
-                        cache_impl = "ConcurrentHashMap"
+                    match = CACHE_IMPL_RE.match(parts)
+                    cache_impl = CACHE_IMPL_KEYWORDS[match.lastindex - 1][1] if match else "Unknown"
 
                     # Determine operation type (improved pattern matching)
                     operation = "Unknown"
                     parts_lower = parts.lower()
-                    if 'get' in parts_lower:
-                        if 'throughput' in parts_lower:
-                            operation = "GET_THROUGHPUT"
-                        else:
-                            operation = "GET_LATENCY"
-                    elif 'put' in parts_lower:
-                        if 'throughput' in parts_lower:
-                            operation = "PUT_THROUGHPUT"
-                        else:
-                            operation = "PUT_LATENCY"
-                    elif 'mixed' in parts_lower:
-                        operation = "MIXED_THROUGHPUT"
+                    match = OPERATION_RE.match(parts_lower)
+                    if match:
+                        _, latency_op, throughput_op = OPERATION_KEYWORDS[match.lastindex - 1]
+                        operation = throughput_op if 'throughput' in parts_lower else latency_op
 
                     # Store result
                     results[cache_impl][operation] = {
@@ -310,21 +306,24 @@ def generate_table(results, test_config):
         "ConcurrentHashMap"
     ]
 
+    # Collect the report and write it with a single print call
+    lines = []
+
     # Generate hardware info header
-    print("=" * 80)
-    print("JCacheX Performance Benchmark Results")
-    print("=" * 80)
-    print()
+    lines.append("=" * 80)
+    lines.append("JCacheX Performance Benchmark Results")
+    lines.append("=" * 80)
+    lines.append("")
 
     for key, value in test_config.items():
-        print(f"{key}: {value}")
-    print()
+        lines.append(f"{key}: {value}")
+    lines.append("")
 
     # Generate main performance table
-    print("Performance Comparison Table")
-    print("-" * 80)
-    print(f"{'Cache Implementation':<25} {'GET Latency (ns)':<18} {'PUT Latency (ns)':<18} {'Throughput (ops/s)':<18}")
-    print("-" * 80)
+    lines.append("Performance Comparison Table")
+    lines.append("-" * 80)
+    lines.append(f"{'Cache Implementation':<25} {'GET Latency (ns)':<18} {'PUT Latency (ns)':<18} {'Throughput (ops/s)':<18}")
+    lines.append("-" * 80)
 
     for cache_impl in cache_implementations:
         if cache_impl in results:
@@ -340,20 +339,20 @@ def generate_table(results, test_config):
             put_str = f"{put_latency:.2f}" if isinstance(put_latency, (int, float)) else str(put_latency)
             throughput_str = f"{throughput:.0f}" if isinstance(throughput, (int, float)) else str(throughput)
 
-            print(f"{cache_impl:<25} {get_str:<18} {put_str:<18} {throughput_str:<18}")
+            lines.append(f"{cache_impl:<25} {get_str:<18} {put_str:<18} {throughput_str:<18}")
         else:
-            print(f"{cache_impl:<25} {'N/A':<18} {'N/A':<18} {'N/A':<18}")
+            lines.append(f"{cache_impl:<25} {'N/A':<18} {'N/A':<18} {'N/A':<18}")
 
-    print("-" * 80)
-    print()
+    lines.append("-" * 80)
+    lines.append("")
 
     # Generate detailed metrics table
-    print("Detailed Metrics by Benchmark Type")
-    print("-" * 80)
+    lines.append("Detailed Metrics by Benchmark Type")
+    lines.append("-" * 80)
 
     for cache_impl in cache_implementations:
         if cache_impl in results:
-            print(f"\n{cache_impl}:")
+            lines.append(f"\n{cache_impl}:")
             cache_results = results[cache_impl]
 
             for operation, data in cache_results.items():
@@ -373,9 +372,11 @@ def generate_table(results, test_config):
                 except (ValueError, TypeError):
                     error_str = f"{str(error):>8}"
 
-                print(f"  {operation:<20} {score_str} ± {error_str} {unit} [{benchmark_type}]")
+                lines.append(f"  {operation:<20} {score_str} ± {error_str} {unit} [{benchmark_type}]")
+
+    lines.append("")
 
-    print()
+    print("\n".join(lines))
 
 def main():
     if len(sys.argv) != 2:
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
+import base64
 import os
 import sys
 import time
 import argparse
+from contextlib import nullcontext
+from multiprocessing import Lock, Process, Queue
+from queue import Empty
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -11,7 +16,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import ElementClickInterceptedException
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, WebDriverException, ElementNotInteractableException
+from selenium.common.exceptions import WebDriverException, ElementNotInteractableException, TimeoutException
+from selenium.common.exceptions import StaleElementReferenceException
 
 
 ROUTES = [
@@ -24,95 +30,313 @@ ROUTES = [
     '/docs',
 ]
 
+BLOCKED_ASSET_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.woff', '*.woff2', '*.ttf']
+
+SCREENSHOT_NAMES = {route: route.strip('/').replace('/', '_') or 'home' for route in ROUTES}
+
+# Each assertion is a tuple of (CSS selector, text) alternatives; it passes when
+# any element matching a selector contains that alternative's text
 ASSERTIONS = {
     '/': [
-        (By.XPATH, "//h1[contains(., 'High-performance Java caching')]")
+        (('h1', 'High-performance Java caching'),)
     ],
     '/examples': [
-        (By.XPATH, "//h1[contains(., 'JCacheX Examples')]")
+        (('h1', 'JCacheX Examples'),)
     ],
     '/spring': [
-        (By.XPATH, "//h1[contains(., 'Spring Boot Integration')]")
+        (('h1', 'Spring Boot Integration'),)
     ],
     '/performance': [
-        (By.XPATH, "//h2[contains(., 'JCacheX Performance Benchmarks')]")
+        (('h2', 'JCacheX Performance Benchmarks'),)
     ],
     '/documentation': [
-        (By.XPATH, "//h1[contains(., 'JCacheX Documentation')]|//h2[contains(., 'Documentation')]")
+        (('h1', 'JCacheX Documentation'), ('h2', 'Documentation'))
     ],
 }
 
 
+# Upper bound for a click's effect (a started navigation, an expanded sidebar group) to land
+CLICK_SETTLE_TIMEOUT = 0.5
+PAGE_LOAD_TIMEOUT = 8
+HISTORY_BACK_TIMEOUT = 3
+SCROLL_TIMEOUT = 2
+MAIN_CONTENT_TIMEOUT = 5
+LINK_CHECK_TIMEOUT = 10
+RESULT_POLL_INTERVAL = 5
+
+CLICKABLES_SELECTOR = "#main-content a[href], #main-content button"
+MAX_CLICKS_PER_PAGE = 30
+SIDEBAR_SELECTOR = ".MuiDrawer-paper"
+# Matched within the sidebar drawer only
+SIDEBAR_ITEM_SELECTOR = ".MuiListItemButton-root"
+
+IN_VIEWPORT_JS = "var r = arguments[0].getBoundingClientRect(); return r.bottom > 0 && r.top < window.innerHeight;"
+
+# Reads everything the click audit needs about each clickable in one round-trip,
+# and decides in-page which ones to skip so Python only acts on real candidates
+PROBE_CLICKABLES_JS = """
+const [selector, limit, baseUrl] = arguments;
+const nodes = document.querySelectorAll(selector);
+const startX = window.scrollX, startY = window.scrollY;
+// Links are not clicked, so hit-test them: is the anchor what a user would click at its centre?
+// Uses the first line box, since the bounding box of a wrapped inline link covers its parent
+const isCovered = el => {
+  el.scrollIntoView({block: 'center', inline: 'center'});
+  const r = el.getClientRects()[0];
+  const hit = document.elementFromPoint(r.left + r.width / 2, r.top + r.height / 2);
+  return !hit || (hit !== el && !el.contains(hit));
+};
+const probe = {
+  total: nodes.length,
+  items: Array.from(nodes).slice(0, limit).map(el => {
+    const cs = getComputedStyle(el);
+    const r = el.getBoundingClientRect();
+    const visible = cs.display !== 'none' && cs.visibility !== 'hidden' && el.getClientRects().length > 0;
+    const href = el.tagName === 'A' ? el.href : null;
+    let skip = null;
+    if (!visible || el.disabled) {
+      skip = 'not displayed or not enabled';
+    } else if (r.width === 0 || r.height === 0) {
+      skip = 'zero size';
+    } else if (href) {
+      // Avoid opening external links during audit
+      if (href.startsWith('http') && !href.startsWith(baseUrl)) {
+        skip = `external link: ${href}`;
+      } else if (el.getAttribute('target') === '_blank') {
+        skip = `target=_blank link: ${href}`;
+      } else if (href.endsWith('#') || href.lastIndexOf('#') === 0) {
+        skip = `hash/self link: ${href}`;
+      }
+    }
+    return {
+      el: el,
+      skip: skip,
+      tag: el.tagName.toLowerCase(),
+      href: href,
+      covered: !skip && href ? isCovered(el) : false,
+      label: (el.innerText || '').trim()
+    };
+  })
+};
+window.scrollTo(startX, startY);
+return probe;
+"""
+
+# Hooks history updates and unloads once per document, then clears the marker they set
+ARM_NAVIGATION_MARKER_JS = """
+if (!window.__auditNavigationHooked) {
+  window.__auditNavigationHooked = true;
+  const mark = () => { window.__auditNavigated = true; };
+  for (const name of ['pushState', 'replaceState']) {
+    const original = history[name];
+    history[name] = function () {
+      mark();
+      return original.apply(this, arguments);
+    };
+  }
+  window.addEventListener('popstate', mark);
+  window.addEventListener('hashchange', mark);
+  window.addEventListener('beforeunload', mark);
+}
+window.__auditNavigated = false;
+return window.location.href;
+"""
+
+# A fresh document (full page load) has no marker at all, which also counts as navigated
+NAVIGATION_STARTED_JS = "return window.__auditNavigated !== false;"
+
+# Resolves each href with a HEAD request; status 0 means the request itself failed
+CHECK_LINKS_JS = """
+const [hrefs, done] = [arguments[0], arguments[arguments.length - 1]];
+Promise.all(hrefs.map(href =>
+  fetch(href, {method: 'HEAD', redirect: 'follow'}).then(r => r.status, () => 0)
+)).then(done);
+"""
+
+# Evaluates every ASSERTIONS entry for a route in-page; true where one of its alternatives matches
+CHECK_ASSERTIONS_JS = """
+return arguments[0].map(alternatives => alternatives.some(([selector, text]) =>
+  Array.from(document.querySelectorAll(selector)).some(el => el.textContent.includes(text))));
+"""
+
+# The sidebar drawer, its items and the expand icons inside them, from one subtree query;
+# null when the page has no sidebar
+PROBE_SIDEBAR_JS = """
+const drawer = document.querySelector(arguments[0]);
+if (!drawer) {
+  return null;
+}
+const items = Array.from(drawer.querySelectorAll(arguments[1]));
+return {
+  drawer: drawer,
+  items: items,
+  expanders: items.map(el => el.querySelector("svg[data-testid='ExpandMoreIcon']")).filter(Boolean)
+};
+"""
+
+
+class RouteLog:
+    """Buffers one route's log lines and prints them as a single block."""
+
+    def __init__(self, lock=None):
+        self.lines = []
+        self.lock = lock
+
+    def add(self, msg: str) -> None:
+        self.lines.append(msg)
+
+    def flush(self) -> None:
+        if not self.lines:
+            return
+        text = "\n".join(self.lines) + "\n"
+        self.lines.clear()
+        # Keep parallel workers from interleaving their blocks
+        with self.lock if self.lock is not None else nullcontext():
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+
+# Set in audit worker processes; _log prints directly when unset
+_route_log = None
+
+
 def _log(msg: str):
-    print(msg, flush=True)
+    if _route_log is not None:
+        _route_log.add(msg)
+    else:
+        print(msg, flush=True)
+
+
+def _wait_for(driver: webdriver.Chrome, condition, timeout: float) -> bool:
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.05).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
+def scroll_into_view(driver: webdriver.Chrome, el) -> None:
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
+    _wait_for(driver, lambda d: d.execute_script(IN_VIEWPORT_JS, el), SCROLL_TIMEOUT)
+
+
+def arm_navigation_marker(driver: webdriver.Chrome) -> str:
+    """Reset the in-page navigation marker before a click; returns the current URL."""
+    return driver.execute_script(ARM_NAVIGATION_MARKER_JS)
+
+
+def wait_for_navigation(driver: webdriver.Chrome, el, original_url: str) -> bool:
+    """Wait for a click's navigation to land, but only if the click started one.
+
+    Most clicks (tabs, copy buttons, toggles) don't navigate; for those this is a
+    single marker read rather than a wait that runs to its timeout.
+    """
+    try:
+        navigated = driver.execute_script(NAVIGATION_STARTED_JS)
+    except WebDriverException:
+        # The page was being torn down mid-call, which is itself a navigation
+        navigated = True
+    if navigated:
+        _wait_for(driver, lambda d: d.current_url != original_url or EC.staleness_of(el)(d), CLICK_SETTLE_TIMEOUT)
+    return navigated
+
+
+def return_to(driver: webdriver.Chrome, url: str) -> None:
+    """Go back to url through history, so the page can come from bfcache; reload it if that fails."""
+    driver.execute_script("history.back();")
+    if not _wait_for(driver, lambda d: d.current_url == url, HISTORY_BACK_TIMEOUT):
+        driver.get(url)
+    _wait_for(driver, EC.presence_of_element_located((By.ID, 'main-content')), MAIN_CONTENT_TIMEOUT)
+
+
+def retry_on_stale(driver: webdriver.Chrome, action, el, idx: int, attempts: int = 2):
+    """Run action(el), re-finding the idx-th clickable if React re-rendered it in the meantime.
+
+    Returns (result, element) so callers keep using the fresh handle.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return action(el), el
+        except StaleElementReferenceException:
+            if attempt == attempts:
+                raise
+            el = driver.find_elements(By.CSS_SELECTOR, CLICKABLES_SELECTOR)[idx]
+
+
+def check_links(driver: webdriver.Chrome, links: List[Tuple[int, str]]) -> int:
+    """HEAD-request every candidate link from inside the page instead of clicking through it."""
+    if not links:
+        return 0
+    issues = 0
+    statuses = driver.execute_async_script(CHECK_LINKS_JS, [href for _, href in links])
+    for (idx, href), status in zip(links, statuses):
+        if 200 <= status < 400:
+            _log(f"    · Link idx {idx} OK ({status}): {href}")
+        else:
+            _log(f"    · Link idx {idx} failed ({status or 'network error'}): {href}; counting as issue")
+            issues += 1
+    return issues
 
 
 def click_all_clickables(driver: webdriver.Chrome, base_url: str) -> int:
     issues = 0
-    clickables = driver.find_elements(By.CSS_SELECTOR, "#main-content a[href], #main-content button")
-    _log(f"  - Found {len(clickables)} clickables in main content")
-    max_to_click = min(len(clickables), 30)
-    for idx in range(max_to_click):
-        el = clickables[idx]
+    probe = driver.execute_script(PROBE_CLICKABLES_JS, CLICKABLES_SELECTOR, MAX_CLICKS_PER_PAGE, base_url)
+    _log(f"  - Found {probe['total']} clickables in main content")
+    links = []
+    for idx, meta in enumerate(probe['items']):
+        if meta['skip']:
+            _log(f"    · Skipping idx {idx}: {meta['skip']}")
+            continue
+        tag = meta['tag']
+        if tag == 'a':
+            # If anchor without href and without onClick handlers, mark issue
+            if not meta['href']:
+                _log(f"    · Missing href on anchor idx {idx}; counting as issue")
+                issues += 1
+            else:
+                if meta['covered']:
+                    # Reported only: a covered anchor may still be reachable by keyboard
+                    _log(f"    · Anchor idx {idx} appears covered by another element")
+                links.append((idx, meta['href']))
+            continue
+        el = meta['el']
         try:
-            # Only interact with visible and enabled elements
-            if not el.is_displayed() or not el.is_enabled():
-                _log(f"    · Skipping idx {idx}: not displayed or not enabled")
-                continue
-            size = el.size or {}
-            if size.get('width', 0) == 0 or size.get('height', 0) == 0:
-                _log(f"    · Skipping idx {idx}: zero size")
-                continue
             # Ensure in view
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
-            time.sleep(0.1)
-            # If anchor without href and without onClick handlers, mark issue
-            tag = el.tag_name.lower()
-            label = (el.text or '').strip()
-            if tag == 'a':
-                href = el.get_attribute('href')
-                if not href:
-                    _log(f"    · Missing href on anchor idx {idx}; counting as issue")
-                    issues += 1
-                    continue
-                # Avoid opening external links during audit
-                if href.startswith('http') and not href.startswith(base_url):
-                    _log(f"    · Skipping external link idx {idx}: {href}")
-                    continue
-                if el.get_attribute('target') == '_blank':
-                    _log(f"    · Skipping target=_blank link idx {idx}: {href}")
-                    continue
-                if href.endswith('#') or href.rsplit('#', 1)[0] == '':
-                    _log(f"    · Skipping hash/self link idx {idx}: {href}")
-                    continue
+            _, el = retry_on_stale(driver, lambda e: scroll_into_view(driver, e), el, idx)
+            label = meta['label']
             try:
-                original_url = driver.current_url
+                original_url = arm_navigation_marker(driver)
                 _log(f"    · Clicking idx {idx}: <{tag}> '{label[:40]}'")
-                el.click()
-                time.sleep(0.1)
-                # If navigation occurred, return safely to original page without relying on history
-                if driver.current_url != original_url and driver.current_url.startswith(base_url):
+                _, el = retry_on_stale(driver, lambda e: e.click(), el, idx)
+                navigated = wait_for_navigation(driver, el, original_url)
+                # If navigation occurred, return to the original page
+                if navigated and driver.current_url != original_url and driver.current_url.startswith(base_url):
                     _log(f"      navigated to {driver.current_url}, returning to {original_url}")
-                    driver.get(original_url)
-                time.sleep(0.1)
+                    return_to(driver, original_url)
             except (ElementNotInteractableException, ElementClickInterceptedException):
                 # Fallback: keyboard activation
                 try:
                     driver.execute_script("arguments[0].focus();", el)
                     _log(f"      click intercepted; trying keyboard activation on idx {idx}")
+                    arm_navigation_marker(driver)
                     el.send_keys("\n")
-                    time.sleep(0.1)
+                    navigated = wait_for_navigation(driver, el, original_url)
                     # If navigation occurred, return to original
-                    if driver.current_url != original_url and driver.current_url.startswith(base_url):
+                    if navigated and driver.current_url != original_url and driver.current_url.startswith(base_url):
                         _log(f"      navigated (keyboard) to {driver.current_url}, returning to {original_url}")
-                        driver.get(original_url)
-                    time.sleep(0.1)
+                        return_to(driver, original_url)
                 except Exception:
                     _log(f"      failed to activate idx {idx}")
                     issues += 1
         except Exception as e:
             _log(f"    · Error on idx {idx}: {type(e).__name__}: {e}")
             issues += 1
+    # Links only need their targets verified, which needs no navigation
+    try:
+        issues += check_links(driver, links)
+    except WebDriverException as e:
+        _log(f"    · Link check failed: {type(e).__name__}: {e}")
+        issues += len(links)
     return issues
 
 
@@ -120,27 +344,34 @@ def click_all_sidebar_items(driver: webdriver.Chrome) -> int:
     """If a sidebar exists, expand and click through all items to scroll to sections."""
     issues = 0
     try:
+        # Find the sidebar items and their expand icons in one DOM traversal
+        sidebar = driver.execute_script(PROBE_SIDEBAR_JS, SIDEBAR_SELECTOR, SIDEBAR_ITEM_SELECTOR)
+        if sidebar is None:
+            return issues
+        drawer = sidebar['drawer']
+        items = sidebar['items']
         # Expand any collapsed parent items by clicking expand icons
-        expanders = driver.find_elements(By.CSS_SELECTOR, ".MuiDrawer-paper .MuiListItemButton-root svg[data-testid='ExpandMoreIcon']")
-        for exp in expanders:
+        for exp in sidebar['expanders']:
             try:
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", exp)
-                time.sleep(0.05)
+                scroll_into_view(driver, exp)
+                item_count = len(drawer.find_elements(By.CSS_SELECTOR, SIDEBAR_ITEM_SELECTOR))
                 exp.click()
-                time.sleep(0.05)
+                # Wait for the expanded section's children to render
+                _wait_for(driver, lambda d: len(drawer.find_elements(By.CSS_SELECTOR, SIDEBAR_ITEM_SELECTOR)) > item_count,
+                          CLICK_SETTLE_TIMEOUT)
             except Exception:
                 continue
+        if sidebar['expanders']:
+            # Expanded groups rendered new items
+            items = drawer.find_elements(By.CSS_SELECTOR, SIDEBAR_ITEM_SELECTOR)
         # Click all sidebar list items to trigger in-page scroll
-        items = driver.find_elements(By.CSS_SELECTOR, ".MuiDrawer-paper .MuiListItemButton-root")
         _log(f"  - Sidebar items visible: {len(items)}")
         for it in items:
             try:
                 if not it.is_displayed():
                     continue
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", it)
-                time.sleep(0.05)
+                scroll_into_view(driver, it)
                 it.click()
-                time.sleep(0.05)
             except Exception:
                 _log("    · Sidebar item click failed; counting as issue")
                 issues += 1
@@ -150,84 +381,219 @@ def click_all_sidebar_items(driver: webdriver.Chrome) -> int:
     return issues
 
 
-def audit(base_url: str, out_dir: Path) -> int:
-    out_dir.mkdir(parents=True, exist_ok=True)
+def build_chrome_options() -> Options:
     chrome_opts = Options()
     chrome_opts.add_argument('--headless=new')
     chrome_opts.add_argument('--no-sandbox')
     chrome_opts.add_argument('--disable-gpu')
     chrome_opts.add_argument('--window-size=1440,900')
+    # Return from get() at DOMContentLoaded; the #main-content wait gates what the audit needs
+    chrome_opts.page_load_strategy = 'eager'
     # Enable browser console logs
     try:
         chrome_opts.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
     except Exception:
         pass
-    driver = None
+    return chrome_opts
+
+
+def block_static_assets(driver: webdriver.Chrome) -> None:
+    """Block images and fonts; the audit checks structure and behaviour, not rendering."""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_ASSET_PATTERNS})
+    except WebDriverException:
+        pass
+
+
+def supports_browser_logs(driver: webdriver.Chrome) -> bool:
+    """Whether the driver exposes the browser console log requested via goog:loggingPrefs."""
+    try:
+        return 'browser' in driver.log_types
+    except Exception:
+        return False
+
+
+def reset_browser_state(driver: webdriver.Chrome) -> None:
+    """Clear cookies and web storage so the next route starts from a clean session."""
+    try:
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except Exception as e:
+        # A dead chromedriver surfaces as urllib3/connection errors, not WebDriverException
+        _log(f"  Could not reset browser state: {type(e).__name__}: {e}")
+
+
+def audit_route(driver: webdriver.Chrome, base_url: str, route: str, url: str, shot_path: Path,
+                supports_logs: bool) -> Tuple[str, int, List[str]]:
     failures = 0
+    errors = []
     try:
-        _log(f"Starting Chrome WebDriver against {base_url}")
-        driver = webdriver.Chrome(options=chrome_opts)
+        _log(f"\nNavigating to: {url}")
+        driver.get(url)
+        # wait for root and main content to appear
         try:
-            driver.set_page_load_timeout(12)
+            WebDriverWait(driver, MAIN_CONTENT_TIMEOUT).until(EC.presence_of_element_located((By.ID, 'root')))
         except Exception:
             pass
-        for route in ROUTES:
-            url = base_url.rstrip('/') + route
-            _log(f"\nNavigating to: {url}")
-            driver.get(url)
-            # wait for root and main content to appear
-            try:
-                WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.ID, 'root')))
-            except Exception:
-                pass
-            try:
-                WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.ID, 'main-content')))
-            except Exception:
-                time.sleep(0.5)
-            # capture console errors
+        try:
+            WebDriverWait(driver, MAIN_CONTENT_TIMEOUT).until(EC.presence_of_element_located((By.ID, 'main-content')))
+        except Exception:
+            time.sleep(0.5)
+        # capture console errors
+        logs = []
+        if supports_logs:
             try:
                 logs = driver.get_log('browser')
-            except Exception:
-                logs = []
-            errors = [l for l in logs if l.get('level') in ('SEVERE', 'ERROR')]
-            _log(f"  Console errors: {len(errors)}")
-            if errors:
+            except WebDriverException:
+                pass
+        # Requests we blocked on purpose are not site errors
+        errors = [str(l) for l in logs
+                  if l.get('level') in ('SEVERE', 'ERROR') and 'ERR_BLOCKED_BY_CLIENT' not in l.get('message', '')]
+        _log(f"  Console errors on {route}: {len(errors)}")
+        if errors:
+            failures += 1
+
+        # assert key elements, all in one round-trip
+        assertions = ASSERTIONS.get(route, [])
+        found = driver.execute_script(CHECK_ASSERTIONS_JS, assertions) if assertions else []
+        for alternatives, present in zip(assertions, found):
+            if not present:
                 failures += 1
-                (out_dir / 'console.log').write_text(
-                    (out_dir / 'console.log').read_text() + f"\n\n# {route}\n" + "\n".join(str(e) for e in errors)
-                    if (out_dir / 'console.log').exists() else
-                    f"# {route}\n" + "\n".join(str(e) for e in errors)
-                )
-
-            # assert key elements
-            for by, sel in ASSERTIONS.get(route, []):
-                try:
-                    driver.find_element(by, sel)
-                except NoSuchElementException:
-                    failures += 1
-                    _log(f"  Missing expected element on {route}: {sel}")
-
-            # clickability audit (main)
-            issues_main = click_all_clickables(driver, base_url)
-            failures += issues_main
-            _log(f"  Click audit (main) issues: {issues_main}")
-            # clickability audit (sidebar navigation)
-            issues_sidebar = click_all_sidebar_items(driver)
-            failures += issues_sidebar
-            _log(f"  Click audit (sidebar) issues: {issues_sidebar}")
-
-            # screenshot
-            safe = route.strip('/').replace('/', '_') or 'home'
-            shot_path = out_dir / f"{safe}.png"
-            driver.save_screenshot(str(shot_path))
-            _log(f"  Saved screenshot: {shot_path}")
+                expected = ' or '.join(f"<{selector}> containing '{text}'" for selector, text in alternatives)
+                _log(f"  Missing expected element on {route}: {expected}")
+
+        # clickability audit (main)
+        issues_main = click_all_clickables(driver, base_url)
+        failures += issues_main
+        _log(f"  Click audit (main) issues on {route}: {issues_main}")
+        # clickability audit (sidebar navigation)
+        issues_sidebar = click_all_sidebar_items(driver)
+        failures += issues_sidebar
+        _log(f"  Click audit (sidebar) issues on {route}: {issues_sidebar}")
+
+        # screenshot
+        # CDP capture skips the WebDriver screenshot command's extra framing
+        shot = driver.execute_cdp_cmd('Page.captureScreenshot', {'format': 'png', 'captureBeyondViewport': False})
+        shot_path.write_bytes(base64.b64decode(shot['data']))
+        _log(f"  Saved screenshot: {shot_path}")
 
     except WebDriverException as e:
-        _log(f"WebDriver error: {e}")
+        _log(f"WebDriver error on {route}: {e}")
         failures += 1
+
+    return route, failures, errors
+
+
+def audit_worker(base_url: str, routes: Queue, results: Queue, output_lock) -> None:
+    """Audit routes from the queue until a None sentinel, reusing one Chrome instance."""
+    global _route_log
+    _route_log = RouteLog(output_lock)
+    driver = None
+    supports_logs = False
+    try:
+        try:
+            driver = webdriver.Chrome(options=build_chrome_options())
+            try:
+                driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+                driver.set_script_timeout(LINK_CHECK_TIMEOUT)
+            except Exception:
+                pass
+            block_static_assets(driver)
+            supports_logs = supports_browser_logs(driver)
+        except Exception as e:
+            _log(f"WebDriver error: {type(e).__name__}: {e}")
+
+        for route, url, shot_path in iter(routes.get, None):
+            # Every route taken off the queue must be reported, whatever happens to the driver
+            result = (route, 1, [])
+            try:
+                if driver is not None:
+                    result = audit_route(driver, base_url, route, url, shot_path, supports_logs)
+            except Exception as e:
+                _log(f"Error auditing {route}: {type(e).__name__}: {e}")
+            _route_log.flush()
+            results.put(result)
+            if driver is not None:
+                reset_browser_state(driver)
     finally:
+        _route_log.flush()
         if driver:
-            driver.quit()
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def collect_results(results: Queue, processes: List[Process], expected: int):
+    """Yield route results until all are in or every worker has exited.
+
+    Workers killed outright (OOM killer, crashed interpreter) never report
+    their route, so the queue is polled rather than blocked on.
+    """
+    received = 0
+    while received < expected:
+        try:
+            yield results.get(timeout=RESULT_POLL_INTERVAL)
+            received += 1
+        except Empty:
+            if not any(process.is_alive() for process in processes):
+                break
+    # Pick up anything the last workers flushed just before exiting
+    while received < expected:
+        try:
+            yield results.get(timeout=RESULT_POLL_INTERVAL)
+            received += 1
+        except Empty:
+            break
+
+
+def audit(base_url: str, out_dir: Path, workers: Optional[int] = None) -> int:
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # Never start more Chrome instances than there are routes to audit
+    workers = min(workers or os.cpu_count() or 1, len(ROUTES))
+    failures = 0
+    _log(f"Starting {workers} Chrome WebDriver worker(s) against {base_url}")
+
+    # Routes are independent; WebDriver sessions are not thread-safe, so each
+    # worker process drives its own long-lived Chrome instance
+    routes = Queue()
+    results = Queue()
+    # Resolve each route's URL and screenshot path once, up front
+    base = base_url.rstrip('/')
+    for route in ROUTES:
+        routes.put((route, base + route, out_dir / f"{SCREENSHOT_NAMES[route]}.png"))
+    for _ in range(workers):
+        routes.put(None)
+    output_lock = Lock()
+    processes = [Process(target=audit_worker, args=(base_url, routes, results, output_lock))
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+
+    # Results arrive in worker-finish order; keep them so console.log follows ROUTES
+    route_errors = {}
+    for route, route_failures, errors in collect_results(results, processes, len(ROUTES)):
+        route_errors[route] = errors
+        failures += route_failures
+    for process in processes:
+        process.join()
+    # Routes whose worker died before reporting them
+    for route in ROUTES:
+        if route not in route_errors:
+            _log(f"No result for {route}: worker exited before reporting it")
+            failures += 1
+
+    # Only the parent writes console.log, one section per route with errors
+    sections = [f"# {route}\n" + "\n".join(route_errors[route])
+                for route in ROUTES if route_errors.get(route)]
+    if sections:
+        with (out_dir / 'console.log').open('a', encoding='utf-8') as console_log:
+            if console_log.tell():
+                console_log.write("\n\n")
+            console_log.write("\n\n".join(sections))
 
     return failures
 
@@ -236,11 +602,15 @@ def main():
     parser = argparse.ArgumentParser(description='Selenium UI audit for JCacheX site')
     parser.add_argument('--base-url', default='http://localhost:3001', help='Base URL where site is served')
     parser.add_argument('--out', default='selenium_screens', help='Output directory for screenshots/logs')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of parallel Chrome instances (default: one per route, capped at CPU count)')
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error('--workers must be at least 1')
 
     out_dir = Path(args.out)
     _log(f"Running audit against {args.base_url}; output: {out_dir}")
-    failures = audit(args.base_url, out_dir)
+    failures = audit(args.base_url, out_dir, args.workers)
     if failures:
         _log(f"Audit completed with {failures} issue(s). See {out_dir} for details.")
         sys.exit(1)